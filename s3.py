@@ -1,12 +1,20 @@
+import contextlib
+import functools
 import os
+import threading
+import urllib.parse
+from concurrent.futures import Future, ThreadPoolExecutor
 from pathlib import Path
-from typing import Literal
+from typing import Literal, NamedTuple
 
 import boto3
+import botocore.session
 import polars as pl
+import pyarrow as pa
 import pyarrow.dataset as ds
 import pyarrow.fs as pafs
 import pyarrow.parquet as pq
+from botocore.config import Config
 from cloudpathlib import AnyPath, CloudPath, S3Client
 from cloudpathlib.local import LocalS3Client
 
@@ -16,6 +24,250 @@ AWS_PROFILE = "AWS_PROFILE"
 AWS_ENDPOINT_URL = "AWS_ENDPOINT_URL"
 AWS_DEFAULT_REGION = "AWS_DEFAULT_REGION"
 
+# Merge nearby column-chunk byte ranges into fewer, larger GETs on S3
+PARQUET_FORMAT = ds.ParquetFileFormat(
+    default_fragment_scan_options=ds.ParquetFragmentScanOptions(
+        pre_buffer=True,
+        cache_options=pa.CacheOptions(
+            hole_size_limit=64 * 1024,
+            range_size_limit=16 * 1024 * 1024,
+        ),
+    )
+)
+
+MAX_POOL_CONNECTIONS = 64
+CONNECTION_CACHE_SIZE = 16
+
+# ~256 KB per batch for typical rows, small enough to stay in L2 per core
+SCAN_BATCH_SIZE = 8192
+
+# Partitioned writes encode on a CPU pool and upload on a separate I/O pool
+UPLOAD_WORKERS = 32
+MIN_ROWS_PER_GROUP = 65_536
+MAX_ROWS_PER_GROUP = 1_048_576
+MAX_ROWS_PER_FILE = 8 * MAX_ROWS_PER_GROUP
+MAX_PARTITIONS = 1024
+WRITE_IN_FLIGHT_BYTES = 256 * 1024 * 1024
+
+# write_dataset options translated by the partitioned writer, and ones it cannot honor
+DATASET_WRITE_OPTIONS = {
+    "max_rows_per_file",
+    "max_rows_per_group",
+    "min_rows_per_group",
+    "max_partitions",
+    "max_open_files",
+    "use_threads",
+}
+UNSUPPORTED_DATASET_OPTIONS = {
+    "file_options",
+    "format",
+    "schema",
+    "partitioning",
+    "partitioning_flavor",
+    "basename_template",
+    "filesystem",
+    "file_visitor",
+    "create_dir",
+}
+
+# zstd-1 with 1 MiB pages: smaller objects than snappy at similar encode cost
+PARQUET_WRITE_OPTIONS = {
+    "compression": "zstd",
+    "compression_level": 1,
+    "use_dictionary": True,
+    "data_page_size": 1 << 20,
+    "write_statistics": True,
+}
+
+# Discovered datasets kept per Storage, so repeated scans skip the S3 LIST calls
+DATASET_CACHE_SIZE = 64
+
+# Concurrent S3 reads are sized to keep about this many row-group bytes in flight
+IO_TARGET_IN_FLIGHT_BYTES = 256 * 1024 * 1024
+MAX_IO_THREADS = 256
+IO_DEPTH_SAMPLE_FILES = 4
+
+# Single files below this size are fetched with one GET instead of per row group
+PREFETCH_MAX_BYTES = 512 * 1024 * 1024
+PARALLEL_DECODE_MAX_TASKS = 256
+
+
+class S3Connection(NamedTuple):
+    session: boto3.Session
+    client: object
+    s3_client: S3Client
+
+
+@functools.lru_cache(maxsize=CONNECTION_CACHE_SIZE)
+def _get_s3_connection(
+    profile_name: str | None,
+    access_key: str | None,
+    secret_key: str | None,
+    endpoint_url: str | None,
+    region_name: str,
+    verify_ssl: bool | str,
+) -> S3Connection:
+    # Shared per credential set so repeated Storage instances reuse warm connections.
+    # The default client config reaches every client of the session, cloudpathlib's too.
+    botocore_session = botocore.session.get_session()
+    botocore_session.set_default_client_config(
+        Config(max_pool_connections=MAX_POOL_CONNECTIONS)
+    )
+    session = boto3.Session(
+        aws_access_key_id=access_key,
+        aws_secret_access_key=secret_key,
+        region_name=region_name,
+        profile_name=profile_name,
+        botocore_session=botocore_session,
+    )
+    client = session.client("s3", endpoint_url=endpoint_url, verify=verify_ssl)
+    s3_client = S3Client(boto3_session=session, endpoint_url=endpoint_url)
+    return S3Connection(session, client, s3_client)
+
+
+@functools.lru_cache(maxsize=CONNECTION_CACHE_SIZE)
+def _get_s3_filesystem(
+    access_key: str,
+    secret_key: str,
+    session_token: str | None,
+    endpoint_url: str | None,
+    region_name: str,
+) -> pafs.S3FileSystem:
+    # Keyed on the frozen credentials, so refreshed role/SSO keys get a new filesystem
+    return pafs.S3FileSystem(
+        access_key=access_key,
+        secret_key=secret_key,
+        session_token=session_token,
+        endpoint_override=endpoint_url,
+        region=region_name,
+    )
+
+
+# Arrow's I/O pool is process-wide: concurrent reads share one override, raised to
+# the largest requested depth and restored only when the last reader finishes
+_io_depth_lock = threading.Lock()
+_io_depth_users = 0
+_io_depth_saved = 0
+
+
+@contextlib.contextmanager
+def _io_thread_depth(depth: int):
+    global _io_depth_users, _io_depth_saved
+    with _io_depth_lock:
+        if _io_depth_users == 0:
+            _io_depth_saved = pa.io_thread_count()
+            pa.set_io_thread_count(depth)
+        elif depth > pa.io_thread_count():
+            pa.set_io_thread_count(depth)
+        _io_depth_users += 1
+    try:
+        yield
+    finally:
+        with _io_depth_lock:
+            _io_depth_users -= 1
+            if _io_depth_users == 0:
+                pa.set_io_thread_count(_io_depth_saved)
+
+
+def _has_categorical(dtype: pl.DataType) -> bool:
+    if isinstance(dtype, (pl.Categorical, pl.Enum)):
+        return True
+    if isinstance(dtype, (pl.List, pl.Array)):
+        return _has_categorical(dtype.inner)
+    if isinstance(dtype, pl.Struct):
+        return any(_has_categorical(f.dtype) for f in dtype.fields)
+    return False
+
+
+def _to_arrow(df: pl.DataFrame) -> pa.Table:
+    # Categorical/Enum export as dictionary<string_view> at the newest level,
+    # which the parquet writer cannot encode; those keep the default export
+    if any(_has_categorical(t) for t in df.schema.values()):
+        return df.to_arrow()
+    # The newest compat level exports polars' buffers (e.g. string views) without copying.
+    # Only hand the result to the parquet writer: Arrow compute kernels (take, cast)
+    # lack string_view support, so anything that runs them needs df.to_arrow()
+    return df.to_arrow(compat_level=pl.CompatLevel.newest())
+
+
+def _parquet_write_options(df: pl.DataFrame, kwargs: dict) -> dict:
+    # byte_stream_split only applies to floats; dictionary still wins when it fits
+    float_cols = [c for c, t in df.schema.items() if t.is_float()]
+    options = {
+        **PARQUET_WRITE_OPTIONS,
+        "use_byte_stream_split": float_cols or False,
+        **kwargs,
+    }
+    # The default level belongs to the default codec; other codecs may reject it
+    if "compression" in kwargs and "compression_level" not in kwargs:
+        del options["compression_level"]
+    return options
+
+
+def _hive_value(value, type: pa.DataType) -> str:
+    if value is None:
+        return "__HIVE_DEFAULT_PARTITION__"
+    if not isinstance(value, str):
+        # Format through Arrow with the column's own type, as write_dataset does
+        # (e.g. 1.0 -> "1", timestamps with their unit's fractional digits)
+        if pa.types.is_dictionary(type):
+            type = type.value_type
+        value = pa.scalar(value, type=type).cast(pa.string()).as_py()
+    return urllib.parse.quote(value, safe="")
+
+
+def _decode_parquet_buffer(buf: bytes) -> pa.Table:
+    buf = pa.py_buffer(buf)
+    pf = pq.ParquetFile(pa.BufferReader(buf))
+    cols = pf.schema_arrow.names
+    cpus = os.cpu_count() or 1
+
+    # Each task pays for its own reader, so fan out only when there are spare cores
+    # and few enough tasks; otherwise Arrow's multithreaded C++ reader is faster
+    n_tasks = pf.num_row_groups * len(cols)
+    if cpus <= 1 or n_tasks == 0 or n_tasks > PARALLEL_DECODE_MAX_TASKS:
+        return pq.read_table(pa.BufferReader(buf))
+
+    # One reader per task over the shared buffer; the footer is parsed only once
+    def read_chunk(i: int, col: str) -> pa.ChunkedArray:
+        reader = pq.ParquetFile(pa.BufferReader(buf), metadata=pf.metadata)
+        return reader.read_row_group(i, columns=[col], use_threads=False).column(0)
+
+    with ThreadPoolExecutor(max_workers=cpus) as pool:
+        futures = {
+            col: [pool.submit(read_chunk, i, col) for i in range(pf.num_row_groups)]
+            for col in cols
+        }
+        arrays = [
+            pa.chunked_array(
+                [c for f in futures[col] for c in f.result().chunks],
+                type=pf.schema_arrow.field(col).type,
+            )
+            for col in cols
+        ]
+
+    return pa.Table.from_arrays(arrays, names=cols)
+
+
+class _ByteBudget:
+    # Blocks acquire() while the budget is used up; a single oversized item is
+    # still let through when nothing else is in flight
+    def __init__(self, limit: int):
+        self._limit = limit
+        self._used = 0
+        self._cond = threading.Condition()
+
+    def acquire(self, nbytes: int):
+        with self._cond:
+            while self._used and self._used + nbytes > self._limit:
+                self._cond.wait()
+            self._used += nbytes
+
+    def release(self, nbytes: int):
+        with self._cond:
+            self._used -= nbytes
+            self._cond.notify_all()
+
 
 class Storage:
     def __init__(
@@ -37,36 +289,37 @@ class Storage:
         self.verify_ssl = verify_ssl
         self.local_s3 = local_s3
         self.local_s3_dir = os.path.abspath(os.path.expanduser(local_s3_dir))
+        self._datasets: dict[str, ds.FileSystemDataset] = {}
+        self._io_depths: dict[str, int] = {}
 
         if local_s3:
             self._init_local_s3()
         else:
             self._init_s3()
+        # Bound once so path() skips the client attribute lookup per call
+        self._cloud_path = self._s3_client.CloudPath
 
     def _init_s3(self):
-        self._session = boto3.Session(
-            aws_access_key_id=self.access_key,
-            aws_secret_access_key=self.secret_key,
-            region_name=self.region_name,
-            profile_name=self.profile_name,
-        )
-        self._client = self._session.client(
-            "s3", endpoint_url=self.endpoint_url, verify=self.verify_ssl
+        conn = _get_s3_connection(
+            self.profile_name,
+            self.access_key,
+            self.secret_key,
+            self.endpoint_url,
+            self.region_name,
+            self.verify_ssl,
         )
+        self._session = conn.session
+        self._client = conn.client
+        self._s3_client = conn.s3_client
 
-        credentials = self._session.get_credentials()
-        frozen_creds = credentials.get_frozen_credentials()
-        access_key = frozen_creds.access_key
-        secret_key = frozen_creds.secret_key
-
-        self._s3_client = S3Client(
-            boto3_session=self._session, endpoint_url=self.endpoint_url
-        )
-        self.s3_fs = pafs.S3FileSystem(
-            access_key=access_key,
-            secret_key=secret_key,
-            endpoint_override=self.endpoint_url,
-            region=self.region_name,
+        # botocore refreshes expiring credentials here, so each Storage sees current keys
+        frozen_creds = self._session.get_credentials().get_frozen_credentials()
+        self.s3_fs = _get_s3_filesystem(
+            frozen_creds.access_key,
+            frozen_creds.secret_key,
+            frozen_creds.token,
+            self.endpoint_url,
+            self.region_name,
         )
 
     def _init_local_s3(self):
@@ -93,13 +346,14 @@ class Storage:
         )
 
     def is_s3_path(self, path: str | AnyPath):
-        return str(path).startswith("s3://")
+        s = path if isinstance(path, str) else str(path)
+        return s[:5] == "s3://"
 
     def path(self, path: str | AnyPath)->Path|CloudPath:
         if not isinstance(path, str):
             return path
-        elif self.is_s3_path(path):
-            return self._s3_client.CloudPath(path)
+        elif path[:5] == "s3://":
+            return self._cloud_path(path)
         else:
             return AnyPath(path)
 
@@ -109,29 +363,71 @@ class Storage:
                 f"Invalid URI: '{s3_uri}'. Storage interface strictly requires 's3://' prefix "
                 f"to ensure environment-agnostic path management."
             )
-        raw_path = str(s3_uri).replace("s3://", "").lstrip("/")
+        s = s3_uri if isinstance(s3_uri, str) else str(s3_uri)
+        raw_path = s.removeprefix("s3://").lstrip("/")
         if self.local_s3:
             return os.path.join(self.local_s3_dir, raw_path)
         return raw_path
 
-    def scan_parquet(self, uri: str | AnyPath, **kwargs):
+    def scan_parquet(
+        self,
+        uri: str | AnyPath,
+        columns: list[str] | None = None,
+        exclude_columns: list[str] | None = None,
+        batch_size: int = SCAN_BATCH_SIZE,
+        **kwargs,
+    ):
         if self.is_s3_path(uri):
             target_path = self.get_arrow_path(uri)
 
-            dataset = ds.dataset(
-                target_path,
-                filesystem=self.s3_fs,
-                format="parquet",
-                partitioning="hive",
-            )
-
-            return pl.scan_pyarrow_dataset(dataset, **kwargs)
+            dataset = self._get_dataset(target_path)
+            lf = pl.scan_pyarrow_dataset(dataset, batch_size=batch_size, **kwargs)
         else:
-            return pl.scan_parquet(uri, **kwargs)
+            lf = pl.scan_parquet(uri, **kwargs)
 
-    def read_parquet(self, uri: str | AnyPath):
-        df = self.scan_parquet(uri=uri).collect()
-        return df
+        # Projection is pushed down to the scanner, so only these chunks are fetched
+        if columns is not None:
+            lf = lf.select(columns)
+        if exclude_columns:
+            lf = lf.select(pl.exclude(exclude_columns))
+        return lf
+
+    def read_parquet(
+        self,
+        uri: str | AnyPath,
+        columns: list[str] | None = None,
+        exclude_columns: list[str] | None = None,
+    ):
+        # A projected read only fetches the selected column chunks through the
+        # scan path, so downloading the whole object would move more bytes
+        projected = columns is not None or bool(exclude_columns)
+        if self.is_s3_path(uri) and not self.local_s3 and not projected:
+            buf = self._prefetch(self.get_arrow_path(uri))
+            if buf is not None:
+                return pl.from_arrow(_decode_parquet_buffer(buf))
+
+        lf = self.scan_parquet(uri=uri, columns=columns, exclude_columns=exclude_columns)
+        if not self.is_s3_path(uri) or self.local_s3:
+            return lf.collect()
+
+        target_path = self.get_arrow_path(uri)
+        depth = self._get_io_depth(target_path, self._get_dataset(target_path))
+        with _io_thread_depth(depth):
+            return lf.collect()
+
+    def _prefetch(self, target_path: str) -> bytes | None:
+        info = self.s3_fs.get_file_info(target_path)
+        if info.type != pafs.FileType.File or info.size >= PREFETCH_MAX_BYTES:
+            return None
+
+        # Hive key=value parts of a single file's path become columns on the scan
+        # path; the raw buffer has no path, so leave those files to the scan
+        partitioning = self._get_dataset(target_path).partitioning
+        if partitioning is not None and len(partitioning.schema) > 0:
+            return None
+
+        with self.s3_fs.open_input_file(target_path) as f:
+            return f.read()
 
     def write_parquet(
         self,
@@ -150,31 +446,205 @@ class Storage:
             partition_cols = [partition_cols]
 
         target_path = self.get_arrow_path(uri)
-        table = df.to_arrow()
 
         if partition_cols:
-            ds.write_dataset(
-                table,
-                base_dir=target_path,
-                basename_template=basename_template,
-                format="parquet",
-                partitioning=partition_cols,
-                partitioning_flavor="hive",
-                filesystem=self.s3_fs,
-                existing_data_behavior=existing_data_behavior,
-                **kwargs,
+            unsupported = UNSUPPORTED_DATASET_OPTIONS & kwargs.keys()
+            if unsupported:
+                raise ValueError(
+                    f"Unsupported options for partitioned writes: {sorted(unsupported)}. "
+                    f"Pass parquet writer options (e.g. compression) as keyword arguments."
+                )
+            dataset_options = {k: kwargs.pop(k) for k in DATASET_WRITE_OPTIONS & kwargs.keys()}
+            self._write_partitions(
+                df,
+                target_path,
+                partition_cols,
+                base_name_template,
+                existing_data_behavior,
+                _parquet_write_options(df.head(0).drop(partition_cols), kwargs),
+                **dataset_options,
             )
         else:
+            table = _to_arrow(df)
             if self.local_s3:
                 os.makedirs(os.path.dirname(target_path), exist_ok=True)
-            pq.write_table(table, target_path, filesystem=self.s3_fs, **kwargs)
+            pq.write_table(
+                table,
+                target_path,
+                filesystem=self.s3_fs,
+                **_parquet_write_options(df, kwargs),
+            )
 
-    def get_partition_columns(self, s3_uri: str) -> list[str]:
+        self.invalidate_cache(uri)
 
-        target_path = self.get_arrow_path(s3_uri)
-        dataset = ds.dataset(
-            target_path, filesystem=self.s3_fs, format="parquet", partitioning="hive"
+    def _write_partitions(
+        self,
+        df: pl.DataFrame,
+        target_path: str,
+        partition_cols: list[str],
+        base_name_template: str,
+        existing_data_behavior: str,
+        write_options: dict,
+        max_rows_per_file: int = MAX_ROWS_PER_FILE,
+        max_rows_per_group: int = MAX_ROWS_PER_GROUP,
+        min_rows_per_group: int = MIN_ROWS_PER_GROUP,
+        max_partitions: int = MAX_PARTITIONS,
+        max_open_files: int | None = None,
+        use_threads: bool = True,
+    ):
+        # Validate everything up front so a bad option fails before any I/O.
+        # Each file is encoded from one contiguous table, so its row groups are
+        # max_rows_per_group rows except the last; min_rows_per_group only needs
+        # checking. max_open_files is moot since files are written in one call.
+        if min_rows_per_group > max_rows_per_group:
+            raise ValueError(
+                f"min_rows_per_group ({min_rows_per_group}) must be less than or equal "
+                f"to max_rows_per_group ({max_rows_per_group})."
+            )
+        if max_rows_per_file and max_rows_per_group > max_rows_per_file:
+            raise ValueError(
+                f"max_rows_per_group ({max_rows_per_group}) must be less than or equal "
+                f"to max_rows_per_file ({max_rows_per_file})."
+            )
+        write_options = {**write_options, "row_group_size": max_rows_per_group}
+        pq.write_table(
+            _to_arrow(df.head(0).drop(partition_cols)),
+            pa.BufferOutputStream(),
+            **write_options,
         )
+
+        partitions = df.partition_by(partition_cols, as_dict=True, include_key=False)
+        if len(partitions) > max_partitions:
+            raise ValueError(
+                f"Fragment would be written into {len(partitions)} partitions. "
+                f"This exceeds the maximum of {max_partitions}."
+            )
+
+        if existing_data_behavior == "error":
+            selector = pafs.FileSelector(target_path, allow_not_found=True, recursive=True)
+            if any(
+                info.type == pafs.FileType.File
+                for info in self.s3_fs.get_file_info(selector)
+            ):
+                raise FileExistsError(
+                    f"Could not write to '{target_path}': directory is not empty."
+                )
+
+        # Files between slicing and finished upload are capped by their in-memory size,
+        # which also covers the (smaller) encoded buffers waiting on an upload slot
+        in_flight = _ByteBudget(WRITE_IN_FLIGHT_BYTES)
+
+        def upload(path: str, buf: pa.Buffer, nbytes: int):
+            try:
+                with self.s3_fs.open_output_stream(path) as f:
+                    f.write(buf)
+            finally:
+                in_flight.release(nbytes)
+
+        def encode(path: str, table: pa.Table, nbytes: int) -> Future:
+            try:
+                sink = pa.BufferOutputStream()
+                pq.write_table(table, sink, **write_options)
+                return upload_pool.submit(upload, path, sink.getvalue(), nbytes)
+            except BaseException:
+                in_flight.release(nbytes)
+                raise
+
+        upload_pool = ThreadPoolExecutor(max_workers=UPLOAD_WORKERS)
+        encode_pool = ThreadPoolExecutor(max_workers=os.cpu_count() if use_threads else 1)
+        # Encoders shut down first, so nothing is submitted to a closed upload pool
+        with upload_pool, encode_pool:
+            encoded = []
+            # Key types feed Arrow casts in _hive_value, so use the default export
+            schema = df.head(0).select(partition_cols).to_arrow().schema
+            key_types = [schema.field(c).type for c in partition_cols]
+            for key, part in partitions.items():
+                part_dir = "/".join(
+                    [target_path.rstrip("/")]
+                    + [
+                        f"{c}={_hive_value(v, t)}"
+                        for c, v, t in zip(partition_cols, key, key_types)
+                    ]
+                )
+                if existing_data_behavior == "delete_matching":
+                    self.s3_fs.delete_dir_contents(part_dir, missing_dir_ok=True)
+                if self.local_s3:
+                    os.makedirs(part_dir, exist_ok=True)
+
+                file_rows = max_rows_per_file or max(part.height, 1)
+                for i, offset in enumerate(range(0, part.height, file_rows)):
+                    chunk = part.slice(offset, file_rows)
+                    nbytes = chunk.estimated_size()
+                    in_flight.acquire(nbytes)
+                    path = f"{part_dir}/{base_name_template.format(i=i)}"
+                    encoded.append(
+                        encode_pool.submit(encode, path, _to_arrow(chunk), nbytes)
+                    )
+
+            for future in encoded:
+                future.result().result()
+
+    def _get_dataset(self, target_path: str) -> ds.FileSystemDataset:
+        dataset = self._datasets.get(target_path)
+        if dataset is None:
+            if len(self._datasets) >= DATASET_CACHE_SIZE:
+                self._datasets.pop(next(iter(self._datasets)))
+            dataset = ds.dataset(
+                target_path,
+                filesystem=self.s3_fs,
+                format=PARQUET_FORMAT,
+                partitioning="hive",
+            )
+            self._datasets[target_path] = dataset
+        return dataset
+
+    def _get_io_depth(self, target_path: str, dataset: ds.FileSystemDataset) -> int:
+        depth = self._io_depths.get(target_path)
+        if depth is not None:
+            return depth
+
+        # Small row groups -> more concurrent requests to hide S3 latency,
+        # large ones -> fewer to cap memory. Footers are sampled across the dataset.
+        depth = 2 * (os.cpu_count() or 1)
+        files = dataset.files
+        sample = files[:: max(1, len(files) // IO_DEPTH_SAMPLE_FILES)][:IO_DEPTH_SAMPLE_FILES]
+        total_bytes = n = 0
+        for path in sample:
+            with self.s3_fs.open_input_file(path) as f:
+                metadata = pq.read_metadata(f)
+            n += metadata.num_row_groups
+            total_bytes += sum(
+                metadata.row_group(i).total_byte_size
+                for i in range(metadata.num_row_groups)
+            )
+        if n and total_bytes:
+            depth = max(depth, int(IO_TARGET_IN_FLIGHT_BYTES / (total_bytes / n)))
+
+        depth = min(depth, MAX_IO_THREADS)
+        self._io_depths[target_path] = depth
+        return depth
+
+    def invalidate_cache(self, uri: str | AnyPath | None = None):
+        if uri is None:
+            self._datasets.clear()
+            self._io_depths.clear()
+            return
+
+        # Drop the dataset itself plus any cached parent or child prefixes
+        target_path = self.get_arrow_path(uri).rstrip("/")
+        for cache in (self._datasets, self._io_depths):
+            for path in list(cache):
+                key = path.rstrip("/")
+                if (
+                    key == target_path
+                    or key.startswith(target_path + "/")
+                    or target_path.startswith(key + "/")
+                ):
+                    del cache[path]
+
+    def get_partition_columns(self, s3_uri: str) -> list[str]:
+
+        dataset = self._get_dataset(self.get_arrow_path(s3_uri))
         return dataset.partitioning.schema.names
 
     def get_partition_values(self, s3_uri: str) -> pl.DataFrame:
@@ -4,6 +4,71 @@ import param
 import polars as pl
 
 
+def categorize_columns(schema: pl.Schema) -> dict[str, list[str]]:
+    # Categorize columns for UI groups (single schema snapshot)
+    items = list(schema.items())
+    num = [c for c, t in items if t.is_numeric()]
+    sb = [c for c, t in items if t in (pl.String, pl.Boolean)]
+    temp = [c for c, t in items if t.is_temporal()]
+    grouped = set(num) | set(sb) | set(temp)
+
+    column_groups = {
+        "🔢 Numerical": num,
+        "🔤 String / Boolean": sb,
+        "📅 Temporal": temp,
+        "📦 Others": [c for c, _ in items if c not in grouped],
+    }
+
+    # Filter empty groups
+    return {k: v for k, v in column_groups.items() if v}
+
+
+def dtype_bucket(dtype: pl.DataType) -> str | None:
+    if dtype.is_float():
+        return "continuous"
+    elif dtype == pl.String or dtype == pl.Boolean or dtype.is_integer():
+        return "discrete"
+    elif dtype.is_temporal():
+        return "temporal"
+    return None
+
+
+# Shared encoding pieces, reused by every chart instead of rebuilt per draw
+_FREQUENCY = alt.Y("count()", title="Frequency")
+_BIN_30 = alt.Bin(maxbins=30)
+
+
+def _continuous_chart(base: alt.Chart, col: str) -> alt.Chart:
+    return base.mark_bar().encode(
+        x=alt.X(f"{col}:Q", bin=_BIN_30, title=col),
+        y=_FREQUENCY,
+        tooltip=[alt.Tooltip(f"{col}:Q", bin=True), "count()"],
+    )
+
+
+def _discrete_chart(base: alt.Chart, col: str) -> alt.Chart:
+    return base.mark_bar().encode(
+        x=alt.X(f"{col}:N", sort="-y", title=col),
+        y=_FREQUENCY,
+        tooltip=[f"{col}:N", "count()"],
+    )
+
+
+def _temporal_chart(base: alt.Chart, col: str) -> alt.Chart:
+    return base.mark_bar().encode(
+        x=alt.X(f"{col}:T", bin=True, title=col),
+        y=_FREQUENCY,
+        tooltip=[alt.Tooltip(f"{col}:T", bin=True), "count()"],
+    )
+
+
+_CHART_BUILDERS = {
+    "continuous": _continuous_chart,
+    "discrete": _discrete_chart,
+    "temporal": _temporal_chart,
+}
+
+
 class ColumnPlot(pn.viewable.Viewer):
     df: pl.DataFrame = param.ClassSelector(class_=pl.DataFrame, allow_refs=True)
     url = param.String(default=None, allow_refs=True, allow_None=True)
@@ -13,9 +78,30 @@ class ColumnPlot(pn.viewable.Viewer):
     describe_fn = param.Callable()
 
     chart = param.ClassSelector(class_=(alt.Chart, dict))
+    stats = param.String(default="")
+
+    # Column changes within this window collapse into a single redraw
+    REFRESH_DEBOUNCE_MS = 150
+
+    _ROW_TMPL = (
+        "<tr><td style='padding:4px; border-bottom:1px solid #eee;'><b>{k}</b></td>"
+        "<td style='text-align:right; padding:4px; border-bottom:1px solid #eee;'>{v}</td></tr>"
+    )
+    _STATS_PREFIX = (
+        "<div style='border:1px solid #ddd; border-radius:4px; padding:8px;'>"
+        "<table style='width:100%; font-size:12px; border-collapse: collapse;'>"
+    )
+    _STATS_SUFFIX = "</table></div>"
 
     def __init__(self, **params):
         super().__init__(**params)
+        self._stats_cache: dict[str, dict] = {}
+        self._refresh_cb = None
+        # Groups passed in by the caller (e.g. DataExplorer) are reused as-is
+        if self.column_groups:
+            self._select_column()
+        else:
+            self.update_source()
         # 1. Create the widget once during initialization
         self._column_select = pn.widgets.Select(
             name="Select Column",
@@ -28,37 +114,19 @@ class ColumnPlot(pn.viewable.Viewer):
             self, value="column", groups="column_groups", bidirectional=True
         )
 
-    @param.depends("df", watch=True, on_init=True)
+    @param.depends("df", watch=True)
     def update_source(self):
-        # 1. Categorize columns for UI groups
-        column_groups = {
-            "🔢 Numerical": [],
-            "🔤 String / Boolean": [],
-            "📅 Temporal": [],
-            "📦 Others": [],
-        }
-
-        for col in self.df.columns:
-            dtype = self.df.schema[col]
-            item = col
+        self._select_column(column_groups=categorize_columns(self.df.schema))
 
-            if dtype.is_numeric():
-                column_groups["🔢 Numerical"].append(item)
-            elif dtype in [pl.String, pl.Boolean]:
-                column_groups["🔤 String / Boolean"].append(item)
-            elif dtype.is_temporal():
-                column_groups["📅 Temporal"].append(item)
-            else:
-                column_groups["📦 Others"].append(item)
-
-        # 2. Filter empty groups
-        self.column_groups = {k: v for k, v in column_groups.items() if v}
-
-        # 3. Set initial value if empty
+    def _select_column(self, **updates):
+        # Set initial value if empty
         if not self.column or self.column not in self.df.columns:
-            self.column = self.df.columns[0]
+            updates["column"] = self.df.columns[0]
 
-        self.param.trigger("column")
+        # Apply together so the linked widget and watchers fire once
+        self.param.update(**updates)
+        if "column" not in updates:
+            self.param.trigger("column")
 
     def draw_chart(self):
         source = self.url if self.url else self.df
@@ -70,84 +138,92 @@ class ColumnPlot(pn.viewable.Viewer):
 
         base = alt.Chart(source).properties(width="container", height=300)
 
-        if dtype.is_float():
-            res = base.mark_bar().encode(
-                x=alt.X(f"{self.column}:Q", bin=alt.Bin(maxbins=30), title=self.column),
-                y=alt.Y("count()", title="Frequency"),
-                tooltip=[alt.Tooltip(f"{self.column}:Q", bin=True), "count()"],
-            )
-        elif dtype == pl.String or dtype == pl.Boolean or dtype.is_integer():
-            res = base.mark_bar().encode(
-                x=alt.X(f"{self.column}:N", sort="-y", title=self.column),
-                y=alt.Y("count()", title="Frequency"),
-                tooltip=[f"{self.column}:N", "count()"],
-            )
-        elif dtype.is_temporal():
-            res = base.mark_bar().encode(
-                x=alt.X(f"{self.column}:T", bin=True, title=self.column),
-                y=alt.Y("count()", title="Frequency"),
-                tooltip=[alt.Tooltip(f"{self.column}:T", bin=True), "count()"],
-            )
-        else:
-            res = base.mark_text().encode(text=alt.value(f"Unsupported: {dtype}"))
+        builder = _CHART_BUILDERS.get(dtype_bucket(dtype))
+        if builder is None:
+            return base.mark_text().encode(text=alt.value(f"Unsupported: {dtype}"))
+
+        return builder(base, self.column)
 
-        return res
+    # Declared before update_chart so the cache is cleared before any redraw
+    @param.depends("df", "describe_fn", watch=True)
+    def _clear_stats_cache(self):
+        self._stats_cache.clear()
 
-    @param.depends("df", "column", watch=True)
+    @param.depends("df", "column", "describe_fn", watch=True)
     def update_chart(self):
-        self.chart = self.draw_chart()
+        if self._refresh_cb is not None:
+            self._refresh_cb.stop()
+            self._refresh_cb = None
+
+        # First draw and non-server contexts render immediately
+        if self.chart is None or pn.state.curdoc is None:
+            self._refresh()
+        else:
+            self._refresh_cb = pn.state.add_periodic_callback(
+                self._refresh, period=self.REFRESH_DEBOUNCE_MS, count=1
+            )
 
-    @param.depends("df", "column")
+    def _refresh(self):
+        self._refresh_cb = None
+        self.param.update(chart=self.draw_chart(), stats=self._render_stats())
+
+    @param.depends("df", "column", "describe_fn")
     def describe(self):
+        if self.column not in self._stats_cache:
+            self._stats_cache[self.column] = self._compute_stats()
+        return self._stats_cache[self.column]
+
+    def _compute_stats(self):
         s = self.df[self.column]
 
         if self.describe_fn is not None:
             return self.describe_fn(s)
 
-        # Basic Metadata
+        # Basic Metadata and numeric specifics in one fused pass over the column
+        c = pl.col(self.column)
+        exprs = [c.null_count().alias("nulls"), c.n_unique().alias("uniq")]
+        is_numeric = s.dtype.is_numeric()
+        if is_numeric:
+            exprs += [
+                c.mean().alias("mean"),
+                c.std().alias("std"),
+                c.min().alias("min"),
+                c.max().alias("max"),
+            ]
+        stats = self.df.lazy().select(exprs).collect().row(0, named=True)
+
         info = {
             "Name": self.column,
             "Type": str(s.dtype),
             "Rows": len(s),
-            "Nulls": s.null_count(),
-            "Unique": s.n_unique(),
+            "Nulls": stats["nulls"],
+            "Unique": stats["uniq"],
         }
 
-        # Numeric Specifics
-        if s.dtype.is_numeric():
+        if is_numeric:
             info.update(
                 {
-                    "Mean": f"{s.mean():.2f}" if s.mean() is not None else "N/A",
-                    "Std": f"{s.std():.2f}" if s.std() is not None else "N/A",
-                    "Min": s.min(),
-                    "Max": s.max(),
+                    "Mean": f"{stats['mean']:.2f}" if stats["mean"] is not None else "N/A",
+                    "Std": f"{stats['std']:.2f}" if stats["std"] is not None else "N/A",
+                    "Min": stats["min"],
+                    "Max": stats["max"],
                 }
             )
 
         return info
 
-    def _render_stats(self, _):
-        # Convert stats dict to HTML table (input '_' is required for pn.bind)
+    def _render_stats(self):
+        # Convert stats dict to HTML table
         data = self.describe()
-        rows = [
-            f"<tr><td style='padding:4px; border-bottom:1px solid #eee;'><b>{k}</b></td>"
-            f"<td style='text-align:right; padding:4px; border-bottom:1px solid #eee;'>{v}</td></tr>"
-            for k, v in data.items()
-        ]
-        return (
-            f"<div style='border:1px solid #ddd; border-radius:4px; padding:8px;'>"
-            f"<table style='width:100%; font-size:12px; border-collapse: collapse;'>{''.join(rows)}</table></div>"
-        )
+        rows = "".join(self._ROW_TMPL.format(k=k, v=v) for k, v in data.items())
+        return self._STATS_PREFIX + rows + self._STATS_SUFFIX
 
     def view(self):
 
         # 2. Controls column (fixed width, contains selector and stats)
         controls = pn.Column(
             self._column_select,
-            pn.pane.HTML(
-                pn.bind(self._render_stats, self.param.column),
-                sizing_mode="stretch_width",
-            ),
+            pn.pane.HTML(self.param.stats, sizing_mode="stretch_width"),
             width=280,
             margin=(0, 20, 0, 0),
         )
@@ -175,45 +251,51 @@ class DataExplorer(pn.viewable.Viewer):
 
     def __init__(self, **params):
         super().__init__(**params)
-        self._all_plots = []
+        self._plots: dict[str, ColumnPlot] = {}
+        self._column_groups: dict[str, list[str]] = {}
+        self._col_category: dict[str, str] = {}
+        self._col_lower: dict[str, str] = {}
         self._update_all_plots()
 
     @param.depends("df", watch=True)
     def _update_all_plots(self):
-        # Create all plots once when df changes
+        # Plots are built lazily in _get_plot; only the shared groups are computed here
+        self._plots = {}
         if self.df is not None:
-            self._all_plots = [
-                ColumnPlot(df=self.df, url=self.url, column=col)
-                for col in self.df.columns
-            ]
+            self._column_groups = categorize_columns(self.df.schema)
+            # Lookup tables for filtering, so keystrokes don't touch the schema
+            self._col_category = {
+                col: label.split(" ", 1)[1]
+                for label, cols in self._column_groups.items()
+                for col in cols
+            }
+            self._col_lower = {col: col.lower() for col in self.df.columns}
+
+    def _get_plot(self, col: str) -> ColumnPlot:
+        if col not in self._plots:
+            self._plots[col] = ColumnPlot(
+                df=self.df,
+                url=self.url,
+                column=col,
+                column_groups=self._column_groups,
+            )
+        return self._plots[col]
 
     @param.depends("search_term", "type_filter")
     def _get_filtered_plots(self):
         # Logic to filter plots based on search and types
-        filtered = self._all_plots
+        filtered = self.df.columns if self.df is not None else []
 
         # Filter by search term
         if self.search_term:
-            filtered = [
-                p for p in filtered if self.search_term.lower() in p.column.lower()
-            ]
+            term = self.search_term.lower()
+            filtered = [c for c in filtered if term in self._col_lower[c]]
 
         # Filter by type (using the internal groups logic of ColumnPlot)
         if self.type_filter:
-            selected_plots = []
-            for p in filtered:
-                dtype = self.df.schema[p.column]
-                category = "Others"
-                if dtype.is_numeric():
-                    category = "Numerical"
-                elif dtype in [pl.String, pl.Boolean]:
-                    category = "String / Boolean"
-                elif dtype.is_temporal():
-                    category = "Temporal"
-
-                if category in self.type_filter:
-                    selected_plots.append(p)
-            filtered = selected_plots
+            filtered = [c for c in filtered if self._col_category[c] in self.type_filter]
+
+        filtered = [self._get_plot(col) for col in filtered]
 
         return pn.FlexBox(
             *filtered, justify_content="start", sizing_mode="stretch_width"